@@ -1,45 +1,185 @@
 import asyncio
+import bisect
 import json
 import logging
-import math
 import random
+from functools import lru_cache
 from pathlib import Path
-from time import monotonic
-from typing import Optional
+from time import monotonic, monotonic_ns
+from typing import Iterable, NamedTuple, Optional, Union
 
-from telegram import Update
-from telegram.ext import ContextTypes
+from telegram import Message, Update
+from telegram.error import BadRequest
+from telegram.ext import ContextTypes, filters
 
 from src.commands.utils import (
-    require_group,
-    require_admin,
+    is_admin,
+    deny_admin,
     record_user,
     countdown_timer,
+    index_teams,
+    team_names,
 )
 from src.commands.scores import show_scores
+from src.commands.state import Question, QuizState, get_quiz
 
 logger = logging.getLogger(__name__)
 
 QUESTIONS_FILE = Path(__file__).resolve(
 ).parent.parent.parent / "questions.json"
 INITIAL_POINTS = 5
-HINT_POINT_STEPS = [
-    {"time": 7, "ratio": 0.0, "points": 4},
-    {"time": 14, "ratio": 0.2, "points": 3},
-    {"time": 21, "ratio": 0.4, "points": 2},
-    {"time": 28, "ratio": 0.6, "points": 1},
-]
+
+
+class HintStep(NamedTuple):
+    time: float  # seconds after the question is sent
+    ratio: float  # share of the answer revealed by this hint
+    points: int  # points for a correct answer after this hint
+
+
+HINT_POINT_STEPS = (
+    HintStep(7, 0.0, 4),
+    HintStep(14, 0.2, 3),
+    HintStep(21, 0.4, 2),
+    HintStep(28, 0.6, 1),
+)
 FINAL_REVEAL_TIME = 35
+ASSET_CACHE_MAX_BYTES = 1024 * 1024
+_MEDIA_TYPES = frozenset({"image", "audio", "video"})
+FILE_ID_CACHE_FILE = QUESTIONS_FILE.with_name(".quizzit_file_ids.json")
+
+# Chats with an open question. Used as the answer handler's filter so
+# messages between questions never reach handle_answer.
+ANSWERING_CHATS = filters.Chat(allow_empty=False)
+
+# Breakpoints for _points_for_elapsed: _HINT_PTS[i] applies once i steps passed
+_HINT_TIMES = tuple(step.time for step in HINT_POINT_STEPS)
+_HINT_PTS = (INITIAL_POINTS,) + tuple(step.points for step in HINT_POINT_STEPS)
+# Reveal ratios as whole percentages so hint sizes use integer ceil division
+_HINT_REVEAL_PCT = tuple(round(step.ratio * 100) for step in HINT_POINT_STEPS)
+
+START_MESSAGE = (
+    "🎊 *QUIZ TIME!* 🎊\n\n"
+    "Get ready to test your knowledge! 🧠\n"
+    "💡 *Type your answers quickly!*"
+)
+# One block per team in the /start status message
+_TEAM_STATUS_TEMPLATE = (
+    "*{name}*\n"
+    "• 🔇 Mute: _{mute}_\n"
+    "• 🔢 Uses left: `{uses}`\n"
+    "• 🏷️ Tags: _{tags}_"
+)
+_MUTE_STATUS = {True: "Enabled", False: "Disabled"}
+
+
+def _str_field(data: dict, key: str, number: int, default: Optional[str] = "") -> Optional[str]:
+    value = data.get(key, default)
+    if value is not default and not isinstance(value, str):
+        raise ValueError(f"Question {number}: '{key}' must be a string")
+    return value
+
+
+def _str_list_field(data: dict, key: str, number: int) -> tuple[str, ...]:
+    value = data.get(key) or []
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"Question {number}: '{key}' must be a list of strings")
+    return tuple(value)
+
+
+def _parse_question(data: dict, number: int) -> Question:
+    """Build a Question from one questions.json entry, raising ValueError if malformed."""
+    if not isinstance(data, dict):
+        raise ValueError(f"Question {number} must be a JSON object")
+    question = _str_field(data, "question", number)
+    answer = _str_field(data, "answer", number)
+    tags = _str_list_field(data, "tags", number)
+    alternatives = _str_list_field(data, "alternative", number)
+    revealable = tuple(i for i, ch in enumerate(answer) if not ch.isspace())
+    prompt = f"*QUESTION {number}*\n\n{question}"
+    if tags:
+        prompt += f"\n\n_Genre: {', '.join(tags)}_"
+    return Question(
+        question=question,
+        answer=answer,
+        type=_str_field(data, "type", number, "text"),
+        file=_str_field(data, "file", number, None),
+        tags=tags,
+        alternative=alternatives,
+        hints=_str_list_field(data, "hints", number),
+        # Precomputed once so the per-message path is a single set lookup
+        expected=frozenset(_normalize(item) for item in (answer, *alternatives)),
+        revealable=revealable,
+        reveal_counts=tuple(-(-len(revealable) * pct // 100) for pct in _HINT_REVEAL_PCT),
+        hint_template=_hint_template(answer),
+        prompt=prompt,
+        reveal_text=f"*❌ No one guessed!*\n\nThe correct answer was: *{answer}*",
+    )
 
 
-def _load_questions() -> list[dict]:
-    """Load questions from JSON file."""
-    with QUESTIONS_FILE.open("r", encoding="utf-8") as fh:
-        return json.load(fh)
+@lru_cache(maxsize=4)
+def _load_cached(path: str, mtime_ns: int) -> list[Question]:
+    """Parse a questions file. Keyed on mtime so edits are picked up."""
+    data = json.loads(Path(path).read_bytes())
+    if not isinstance(data, list):
+        raise ValueError(f"{path} must contain a JSON list of questions")
+    return [_parse_question(q, number) for number, q in enumerate(data, start=1)]
 
 
-def _get_quiz_data(context: ContextTypes.DEFAULT_TYPE) -> dict:
-    return context.chat_data.setdefault("quiz", {})
+def load_questions() -> list[Question]:
+    """Load questions from JSON file.
+
+    The parsed list is shared between chats and must be treated as read-only.
+    """
+    st = QUESTIONS_FILE.stat()
+    return _load_cached(str(QUESTIONS_FILE), st.st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _read_small_asset(path: str, mtime_ns: int) -> bytes:
+    return Path(path).read_bytes()
+
+
+def _read_asset(asset_path: Path) -> bytes:
+    """Read a media asset, keeping small files cached between rounds."""
+    st = asset_path.stat()
+    if st.st_size <= ASSET_CACHE_MAX_BYTES:
+        return _read_small_asset(str(asset_path), st.st_mtime_ns)
+    return asset_path.read_bytes()
+
+
+_file_ids: Optional[dict[str, str]] = None
+# Saves share one temp file, so only one may be writing at a time
+_file_ids_save_lock = asyncio.Lock()
+
+
+def _file_id_cache() -> dict[str, str]:
+    """Telegram file_ids of uploaded assets, keyed by "path@mtime_ns"."""
+    global _file_ids
+    if _file_ids is None:
+        try:
+            _file_ids = json.loads(FILE_ID_CACHE_FILE.read_bytes())
+        except FileNotFoundError:
+            _file_ids = {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable file_id cache %s: %s", FILE_ID_CACHE_FILE, e)
+            _file_ids = {}
+    return _file_ids
+
+
+def _write_file_id_cache(snapshot: dict[str, str]) -> None:
+    try:
+        tmp = FILE_ID_CACHE_FILE.with_suffix(".tmp")
+        tmp.write_text(json.dumps(snapshot, indent=2))
+        tmp.replace(FILE_ID_CACHE_FILE)
+    except OSError as e:
+        logger.warning("Could not persist file_id cache to %s: %s", FILE_ID_CACHE_FILE, e)
+
+
+async def _save_file_id_cache() -> None:
+    """Write the file_id cache to disk off the event loop."""
+    async with _file_ids_save_lock:
+        # Snapshot under the lock so the last save to finish has the latest ids
+        await asyncio.to_thread(_write_file_id_cache, dict(_file_id_cache()))
 
 
 def _clear_quiz_state(context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -47,80 +187,76 @@ def _clear_quiz_state(context: ContextTypes.DEFAULT_TYPE) -> None:
 
 
 def _normalize(text: str) -> str:
-    """Lowercase and trim for lenient answer matching."""
-    return text.strip().lower()
-
-
-def _cancel_pending_tasks(chat_data: dict) -> None:
-    """Cancel all scheduled hint/reveal tasks, avoiding self-cancellation."""
-    tasks: list[asyncio.Task] = chat_data.pop("hint_tasks", [])
-    current_task = asyncio.current_task()
-    for task in tasks:
-        if task is current_task:
-            continue
-        if not task.done():
-            task.cancel()
-
-
-def _reset_question_state(chat_data: dict, next_index: int) -> int:
-    """Reset all per-question state atomically and return the new generation ID."""
-    _cancel_pending_tasks(chat_data)
-    generation = chat_data.get("generation", 0) + 1
-
-    chat_data.update({
-        "index": next_index,
-        "generation": generation,
-        "answered": False,
-        "accepting_answers": False,
-        "question_start_ts": None,
-        "current_points": INITIAL_POINTS,
-        "hint_tasks": [],
-        "revealed_indices": set(),
-    })
+    """Casefold and trim for lenient answer matching."""
+    return text.strip().casefold()
+
 
+async def _cancel_hint_task(quiz: QuizState) -> None:
+    """Cancel the scheduled hint/reveal task and wait for it to finish.
+
+    The calling task is skipped, so the hint pipeline can move on to the
+    next question without cancelling itself.
+    """
+    task = quiz.hint_task
+    quiz.hint_task = None
+    if task is None or task is asyncio.current_task() or task.done():
+        return
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def _reset_question_state(quiz: QuizState, next_index: int) -> int:
+    """Reset all per-question state and return the new generation ID."""
+    # Bump the generation before yielding so old tasks see themselves as stale
+    generation = quiz.generation + 1
+
+    quiz.index = next_index
+    quiz.generation = generation
+    quiz.answered = False
+    quiz.accepting_answers = False
+    quiz.question_start_ts = None
+    quiz.current_points = INITIAL_POINTS
+
+    await _cancel_hint_task(quiz)
     return generation
 
 
-def _is_stale(chat_data: dict, generation: int) -> bool:
+def _is_stale(quiz: QuizState, generation: int) -> bool:
     """Check if the current generation is stale."""
-    return chat_data.get("generation") != generation or chat_data.get("answered", False)
+    return quiz.generation != generation or quiz.answered
 
 
-def _is_accepting_answers(chat_data: dict) -> bool:
-    return chat_data.get("accepting_answers", False) and not chat_data.get("answered", False)
+def _is_accepting_answers(quiz: QuizState) -> bool:
+    return quiz.accepting_answers and not quiz.answered
 
 
 def _points_for_elapsed(seconds: float) -> int:
-    if not HINT_POINT_STEPS or seconds < HINT_POINT_STEPS[0]["time"]:
-        return INITIAL_POINTS
-
-    points = HINT_POINT_STEPS[-1]["points"]
-    for step in HINT_POINT_STEPS:
-        if seconds < step["time"]:
-            break
-        points = step["points"]
-    return points
-
-
-def _build_progressive_hint(answer: str, revealed: set[int]) -> str:
-    masked = []
-    for idx, ch in enumerate(answer):
-        if ch.isspace():
-            masked.append("  ")
-        elif idx in revealed:
-            masked.append(ch)
-        else:
-            masked.append("_ ")
+    return _HINT_PTS[bisect.bisect_right(_HINT_TIMES, seconds)]
+
+
+def _hint_template(answer: str) -> tuple[str, ...]:
+    """Fully masked hint fragments, one per answer character."""
+    return tuple("  " if ch.isspace() else "_ " for ch in answer)
+
+
+def _build_progressive_hint(
+    answer: str,
+    revealed: Iterable[int],
+    template: Optional[tuple[str, ...]] = None,
+) -> str:
+    masked = list(template if template is not None else _hint_template(answer))
+    for idx in revealed:
+        masked[idx] = answer[idx]
     return "".join(masked).strip()
 
 
 async def _send_hint_dm(
     user_id: int,
     idx: int,
-    question: dict,
+    question: Question,
     context: ContextTypes.DEFAULT_TYPE
 ) -> None:
-    hints = question.get("hints") or []
+    hints = question.hints
     if hints:
         hint_text = random.choice(hints)
     else:
@@ -130,104 +266,197 @@ async def _send_hint_dm(
     await context.bot.send_message(chat_id=user_id, text=text)
 
 
+def _sent_file_id(message: Message, media_type: str) -> Optional[str]:
+    """Extract the reusable Telegram file_id from a sent media message."""
+    if media_type == "image":
+        return message.photo[-1].file_id if message.photo else None
+    media = message.audio if media_type == "audio" else message.video
+    return media.file_id if media else None
+
+
+async def _load_media(asset_path: Path) -> tuple[str, Union[str, bytes]]:
+    """Return the asset's cache key and either its cached file_id or its bytes."""
+    # Keyed on mtime so an edited asset gets uploaded again
+    cache_key = f"{asset_path}@{asset_path.stat().st_mtime_ns}"
+    media = _file_id_cache().get(cache_key)
+    if media is None:
+        # Disk reads happen off the event loop so hint timers stay on schedule
+        media = await asyncio.to_thread(_read_asset, asset_path)
+    return cache_key, media
+
+
+def _prefetch_media(quiz: QuizState, next_index: int) -> None:
+    """Start loading the next question's media while the current one wraps up."""
+    if next_index >= len(quiz.questions):
+        return
+    question = quiz.questions[next_index]
+    if not question.file or question.type not in _MEDIA_TYPES:
+        return
+
+    async def _fetch() -> Optional[tuple[str, Union[str, bytes]]]:
+        try:
+            return await _load_media(Path(question.file))
+        except Exception as e:
+            # send_question loads it again and reports the failure there
+            logger.info("Prefetching %s failed: %s", question.file, e)
+            return None
+
+    quiz.media_prefetch = (next_index, asyncio.create_task(_fetch()))
+
+
+async def _send_media(
+    context: ContextTypes.DEFAULT_TYPE,
+    chat_id: int,
+    asset_path: Path,
+    media_type: str,
+    media: Union[str, bytes],
+    caption: str,
+) -> Message:
+    if media_type == "image":
+        return await context.bot.send_photo(
+            chat_id=chat_id, photo=media, filename=asset_path.name,
+            caption=caption, parse_mode="Markdown"
+        )
+    if media_type == "audio":
+        return await context.bot.send_audio(
+            chat_id=chat_id, audio=media, filename=asset_path.name,
+            caption=caption, parse_mode="Markdown"
+        )
+    if media_type == "video":
+        return await context.bot.send_video(
+            chat_id=chat_id, video=media, filename=asset_path.name,
+            caption=caption, parse_mode="Markdown"
+        )
+    raise ValueError(f"Unsupported media type: {media_type}")
+
+
 async def _send_question_media_with_caption(
     context: ContextTypes.DEFAULT_TYPE,
     chat_id: int,
     asset_path: Path,
     media_type: str,
-    caption: str
-) -> None:
+    caption: str,
+    prefetched: Optional[asyncio.Task] = None,
+) -> Optional[Message]:
+    file_ids = _file_id_cache()
+    media = None
     try:
-        with asset_path.open("rb") as fh:
-            if media_type == "image":
-                await context.bot.send_photo(
-                    chat_id=chat_id, photo=fh, caption=caption, parse_mode="Markdown"
-                )
-            elif media_type == "audio":
-                await context.bot.send_audio(
-                    chat_id=chat_id, audio=fh, caption=caption, parse_mode="Markdown"
-                )
-            elif media_type == "video":
-                await context.bot.send_video(
-                    chat_id=chat_id, video=fh, caption=caption, parse_mode="Markdown"
-                )
+        loaded = await prefetched if prefetched is not None else None
+        cache_key, media = loaded or await _load_media(asset_path)
+        sent = await _send_media(context, chat_id, asset_path, media_type, media, caption)
+    except BadRequest as e:
+        if not isinstance(media, str):
+            logger.warning("Failed to send %s asset %s: %s", media_type, asset_path, e)
+            return None
+        # Telegram rejected the file_id itself: drop it, on disk too, and upload afresh.
+        # Other errors (timeouts, flood control) leave the id alone and aren't retried.
+        logger.info("Cached file_id for %s was rejected (%s); re-uploading", asset_path, e)
+        file_ids.pop(cache_key, None)
+        await _save_file_id_cache()
+        try:
+            media = await asyncio.to_thread(_read_asset, asset_path)
+            sent = await _send_media(context, chat_id, asset_path, media_type, media, caption)
+        except Exception as e:
+            logger.warning("Failed to send %s asset %s: %s", media_type, asset_path, e)
+            return None
     except Exception as e:
-        logger.warning(f"Failed to send {media_type} asset {asset_path}: {e}")
+        logger.warning("Failed to send %s asset %s: %s", media_type, asset_path, e)
+        return None
+
+    file_id = _sent_file_id(sent, media_type)
+    if file_id and file_ids.get(cache_key) != file_id:
+        file_ids[cache_key] = file_id
+        await _save_file_id_cache()
+    return sent
 
 
 def _schedule_hints(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    chat_data: dict,
+    quiz: QuizState,
     chat_id: int,
-    answer: str,
+    question: Question,
     generation: int,
 ) -> None:
     """Schedule timed hint reveals and auto-reveal for the current question."""
+    answer = question.answer
     if not answer:
         return
 
-    revealable_indices = [i for i, ch in enumerate(answer) if not ch.isspace()]
-    reveal_order = revealable_indices.copy()
-    random.shuffle(reveal_order)
-    chat_data["reveal_order"] = reveal_order
+    revealable = question.revealable
+    reveal_order = random.sample(revealable, len(revealable))
 
-    async def _send_hint(delay: int, ratio: float, points: int) -> None:
-        try:
-            await asyncio.sleep(delay)
-            if _is_stale(chat_data, generation):
-                return
+    # The reveal order is fixed up front, so every hint for this question
+    # can be rendered once here instead of on each tick.
+    template = question.hint_template
+    precomputed = [
+        _build_progressive_hint(answer, reveal_order[:target_count], template)
+        for target_count in question.reveal_counts
+    ]
 
-            target_count = math.ceil(len(reveal_order) * ratio)
-            revealed = set(reveal_order[:target_count])
-            chat_data["revealed_indices"] = revealed
-            chat_data["current_points"] = points
+    async def _send_hint(step_idx: int, points: int) -> None:
+        try:
+            hint_text = precomputed[step_idx]
+            quiz.current_points = points
 
-            hint_text = _build_progressive_hint(answer, revealed)
             await context.bot.send_message(chat_id=chat_id, text=f"Hint: {hint_text}")
-        except asyncio.CancelledError:
-            pass
         except Exception as e:
-            logger.warning(f"Failed to send hint: {e}")
+            logger.warning("Failed to send hint: %s", e)
 
-    async def _timeout_reveal(delay: int) -> None:
+    async def _timeout_reveal() -> None:
         try:
-            await asyncio.sleep(delay)
-            if _is_stale(chat_data, generation):
-                return
+            quiz.answered = True
+            ANSWERING_CHATS.remove_chat_ids(chat_id)
+            _prefetch_media(quiz, quiz.index + 1)
 
-            chat_data["answered"] = True
+            # The countdown runs while the reveal is on its way
+            wait_seconds = context.bot_data.get("QUIZ_DELAY_SECONDS", 0)
+            countdown = asyncio.create_task(
+                countdown_timer(context=context, chat_id=chat_id, seconds=wait_seconds))
 
             await context.bot.send_message(
                 chat_id=chat_id,
-                text=f"*❌ No one guessed!*\n\nThe correct answer was: *{answer}*",
+                text=question.reveal_text,
                 parse_mode="Markdown"
             )
 
-            wait_seconds = context.bot_data.get("QUIZ_DELAY_SECONDS", 0)
-            if wait_seconds > 0:
-                try:
-                    await countdown_timer(context=context, chat_id=chat_id, seconds=wait_seconds)
-                except Exception:
-                    logger.warning(
-                        "Countdown after timeout failed; continuing anyway")
+            try:
+                await countdown
+            except Exception:
+                logger.warning(
+                    "Countdown after timeout failed; continuing anyway")
 
             logger.info("Proceeding to next question after timeout")
-            next_index = chat_data.get("index", 0) + 1
+            next_index = quiz.index + 1
             await send_question(update, context, next_index)
 
+        except Exception as e:
+            logger.warning("Timeout reveal failed: %s", e)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    async def _sleep_until(offset: float) -> None:
+        # Deadlines are absolute so time spent sending a hint doesn't push later ones back
+        await asyncio.sleep(max(0.0, started + offset - loop.time()))
+
+    async def _hint_pipeline() -> None:
+        """Run every hint step and the final reveal from a single task."""
+        try:
+            for step_idx, step in enumerate(HINT_POINT_STEPS):
+                await _sleep_until(step.time)
+                if _is_stale(quiz, generation):
+                    return
+                await _send_hint(step_idx, step.points)
+
+            await _sleep_until(FINAL_REVEAL_TIME)
+            if _is_stale(quiz, generation):
+                return
+            await _timeout_reveal()
         except asyncio.CancelledError:
             pass
-        except Exception as e:
-            logger.warning(f"Timeout reveal failed: {e}")
-
-    chat_data["hint_tasks"] = [
-        asyncio.create_task(_send_hint(
-            step["time"], step["ratio"], step["points"]))
-        for step in HINT_POINT_STEPS
-    ] + [
-        asyncio.create_task(_timeout_reveal(FINAL_REVEAL_TIME)),
-    ]
+
+    quiz.hint_task = asyncio.create_task(_hint_pipeline())
 
 
 async def send_question(
@@ -237,158 +466,130 @@ async def send_question(
 ) -> None:
     """Send the next question to the chat."""
     chat_id = update.effective_chat.id
-    quiz = _get_quiz_data(context)
-    questions: list[dict] = quiz["questions"]
+    quiz = get_quiz(context)
+    questions = quiz.questions
 
     if next_index is None:
-        next_index = quiz.get("index", 0)
+        next_index = quiz.index
+
+    # Closed until the next question is actually out
+    ANSWERING_CHATS.remove_chat_ids(chat_id)
 
     if next_index >= len(questions):
-        await show_scores(update, context, force=True)
+        # Nobody scored: skip the "no scores yet" prompt at game end
+        if quiz.scores:
+            await show_scores(update, context, force=True)
         _clear_quiz_state(context)
         return
 
     idx = next_index
 
-    generation = _reset_question_state(quiz, idx)
+    generation = await _reset_question_state(quiz, idx)
 
-    logger.info(
-        f"Sending question {idx + 1} (gen={generation}) to chat {chat_id}")
+    logger.info("Sending question %s (gen=%s) to chat %s", idx + 1, generation, chat_id)
 
     question_data = questions[idx]
-    question_text = question_data.get("question", "")
-    question_type = question_data.get("type", "text")
-    answer = question_data.get("answer", "")
-    file_path = question_data.get("file")
+    question_text = question_data.question
+    question_type = question_data.type
+    file_path = question_data.file
 
     try:
-        logger.info(f"Question {idx + 1} content: {question_text}")
-        tags = question_data.get("tags") or []
-        if tags:
-            tags_text = ", ".join(tags)
-            full_message = f"*QUESTION {idx + 1}*\n\n{question_text}\n\n_Genre: {tags_text}_"
-        else:
-            full_message = f"*QUESTION {idx + 1}*\n\n{question_text}"
-
-        if file_path and question_type in {"image", "audio", "video"}:
-            await _send_question_media_with_caption(
-                context, chat_id, Path(file_path), question_type, full_message
+        logger.info("Question %s content: %s", idx + 1, question_text)
+        full_message = question_data.prompt
+
+        prefetch = quiz.media_prefetch
+        quiz.media_prefetch = None
+        sent = None
+        if file_path and question_type in _MEDIA_TYPES:
+            sent = await _send_question_media_with_caption(
+                context, chat_id, Path(file_path), question_type, full_message,
+                prefetch[1] if prefetch and prefetch[0] == idx else None,
             )
-        else:
+            if sent is None:
+                logger.warning("Sending question %s as text: its media could not be sent", idx + 1)
+        if sent is None:
+            # Text questions, and media questions whose asset failed, go out as text;
+            # if that fails too, the except below handles both the same way
             await context.bot.send_message(
                 chat_id=chat_id, text=full_message, parse_mode="Markdown"
             )
 
-        quiz["question_start_ts"] = monotonic()
-        quiz["accepting_answers"] = True
+        quiz.question_start_ts = monotonic_ns()
+        quiz.accepting_answers = True
+        ANSWERING_CHATS.add_chat_ids(chat_id)
         _schedule_hints(update, context, quiz,
-                        chat_id, answer, generation)
+                        chat_id, question_data, generation)
 
-        logger.info(f"Question {idx + 1} sent successfully to chat {chat_id}")
+        logger.info("Question %s sent successfully to chat %s", idx + 1, chat_id)
 
     except Exception as e:
-        logger.warning(f"Failed to send question {idx + 1}: {e}")
-        quiz["answered"] = True
+        logger.warning("Failed to send question %s: %s", idx + 1, e)
+        quiz.answered = True
 
 
 # -----------------------------------------------------------------------------
 # Command handlers
 # -----------------------------------------------------------------------------
 
-@require_group
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Start the quiz in the group chat."""
-    if not await require_admin(update, context):
+    if not is_admin(update, context):
+        await deny_admin(update, context)
         return
 
-    questions = _load_questions()
-    logger.info(f"Loaded {len(questions)} questions from {QUESTIONS_FILE}")
+    # Usually a cache hit, but an edited questions.json is re-parsed off the loop
+    questions = await asyncio.to_thread(load_questions)
+    logger.info("Loaded %s questions from %s", len(questions), QUESTIONS_FILE)
 
     # Preserve any pre-existing teams (e.g. created via /group before /start)
-    existing_quiz = context.chat_data.get("quiz", {}) or {}
-    preserved_teams = existing_quiz.get("teams")
-    preserved_mute_enabled = existing_quiz.get("mute_enabled")
-    preserved_mute_uses = existing_quiz.get("mute_uses")
-    preserved_muted_team = existing_quiz.get("muted_team")
-    preserved_muted_until = existing_quiz.get("muted_until")
-    preserved_double_tags = existing_quiz.get("double_tags")
+    existing_quiz = context.chat_data.get("quiz")
 
     # Store all quiz state under a single `quiz` namespace
-    new_quiz = {
-        "questions": questions,
-        "index": 0,
-        "scores": {},
-        "answered": False,
-        "last_winning_team": None,
-        "winning_streak": 0,
-    }
-    if preserved_teams is not None:
-        new_quiz["teams"] = preserved_teams
-    if preserved_mute_enabled is not None:
-        new_quiz["mute_enabled"] = preserved_mute_enabled
-    if preserved_mute_uses is not None:
-        new_quiz["mute_uses"] = preserved_mute_uses
-    if preserved_muted_team is not None:
-        new_quiz["muted_team"] = preserved_muted_team
-    if preserved_muted_until is not None:
-        new_quiz["muted_until"] = preserved_muted_until
-    if preserved_double_tags is not None:
-        new_quiz["double_tags"] = preserved_double_tags
+    new_quiz = QuizState(questions=questions)
+    if existing_quiz is not None:
+        new_quiz.teams = existing_quiz.teams
+        new_quiz.user_team = index_teams(existing_quiz.teams)
+        new_quiz.mute_enabled = existing_quiz.mute_enabled
+        new_quiz.mute_uses = existing_quiz.mute_uses
+        new_quiz.mute_deadlines = existing_quiz.mute_deadlines
+        new_quiz.double_tags = existing_quiz.double_tags
 
     context.chat_data["quiz"] = new_quiz
 
-    start_message = (
-        "🎊 *QUIZ TIME!* 🎊\n\n"
-        "Get ready to test your knowledge! 🧠\n"
-        "💡 *Type your answers quickly!*"
-    )
-    await context.bot.send_message(chat_id=update.effective_chat.id, text=start_message, parse_mode="Markdown")
+    # The countdown runs while the start and team status messages go out
+    wait_seconds = context.bot_data.get("QUIZ_DELAY_SECONDS", 0)
+    countdown = asyncio.create_task(countdown_timer(
+        context=context,
+        chat_id=update.effective_chat.id,
+        seconds=wait_seconds,
+    ))
+
+    await context.bot.send_message(chat_id=update.effective_chat.id, text=START_MESSAGE, parse_mode="Markdown")
 
     try:
-        name_a = context.bot_data.get("TEAM_NAME_A", "A")
-        name_b = context.bot_data.get("TEAM_NAME_B", "B")
-
-        mute_enabled = new_quiz.get("mute_enabled", {})
-        mute_uses = new_quiz.get("mute_uses", {})
-        double_tags = new_quiz.get("double_tags", {})
-
-        a_mute_enabled = mute_enabled.get("A", False)
-        b_mute_enabled = mute_enabled.get("B", False)
-        a_mute_uses = mute_uses.get("A", 0)
-        b_mute_uses = mute_uses.get("B", 0)
-
-        a_tags = sorted(list(double_tags.get("A", set()))
-                        ) if double_tags else []
-        b_tags = sorted(list(double_tags.get("B", set()))
-                        ) if double_tags else []
-
-        status_text = (
-            "*📊 Current Team Settings*\n\n"
-            f"*{name_a}*\n"
-            f"• 🔇 Mute: _{'Enabled' if a_mute_enabled else 'Disabled'}_\n"
-            f"• 🔢 Uses left: `{a_mute_uses}`\n"
-            f"• 🏷️ Tags: _{', '.join(a_tags) if a_tags else 'none'}_\n\n"
-            f"*{name_b}*\n"
-            f"• 🔇 Mute: _{'Enabled' if b_mute_enabled else 'Disabled'}_\n"
-            f"• 🔢 Uses left: `{b_mute_uses}`\n"
-            f"• 🏷️ Tags: _{', '.join(b_tags) if b_tags else 'none'}_"
-        )
+        names = team_names(context)
+
+        blocks = [
+            _TEAM_STATUS_TEMPLATE.format(
+                name=name,
+                mute=_MUTE_STATUS[bool(new_quiz.mute_enabled.get(label, False))],
+                uses=new_quiz.mute_uses.get(label, 0),
+                tags=", ".join(sorted(new_quiz.double_tags.get(label, ()))) or "none",
+            )
+            for label, name in names.items()
+        ]
+        status_text = "*📊 Current Team Settings*\n\n" + "\n\n".join(blocks)
 
         await context.bot.send_message(chat_id=update.effective_chat.id, text=status_text, parse_mode="Markdown")
     except Exception:
         logger.info("Failed to send team status on start")
 
-    wait_seconds = context.bot_data.get("QUIZ_DELAY_SECONDS", 0)
-    await countdown_timer(
-        context=context,
-        chat_id=update.effective_chat.id,
-        seconds=wait_seconds,
-    )
+    await countdown
 
     try:
         await send_question(update, context)
     except Exception as err:
-        logger.warning(f"Failed to send initial question: {err}")
+        logger.warning("Failed to send initial question: %s", err)
 
 
 async def hint(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -397,15 +598,16 @@ async def hint(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if not user:
         return
 
-    quiz = context.chat_data.get("quiz", {})
-    questions: list[dict] = quiz.get("questions")
+    quiz = get_quiz(context)
+    questions = quiz.questions
     if not questions:
         await update.message.reply_text("Quiz not started here. Send /start to begin.")
         return
 
-    idx = quiz.get("index", 0) % len(questions)
+    # send_question only ever stores an in-range index
+    idx = quiz.index
     current_question = questions[idx]
-    question_hints = current_question.get("hints") or []
+    question_hints = current_question.hints
     if not question_hints:
         try:
             await context.bot.send_message(
@@ -413,8 +615,7 @@ async def hint(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
                 text=f"No hint available for Question {idx + 1}."
             )
         except Exception:
-            logger.info(
-                f"Could not DM {user.full_name} about missing hint.")
+            logger.info("Could not DM %s about missing hint.", user.full_name)
         return
 
     # Track per-chat per-user hint usage. Structure:
@@ -431,8 +632,7 @@ async def hint(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
                 text=f"No more hints available. You've used all {MAX_HINTS} hints."
             )
         except Exception:
-            logger.info(
-                f"Could not DM {user.full_name} about hint limit.")
+            logger.info("Could not DM %s about hint limit.", user.full_name)
         return
 
     if idx in entry["questions"]:
@@ -442,8 +642,7 @@ async def hint(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
                 text=f"You've already received a hint for Question {idx + 1}."
             )
         except Exception:
-            logger.info(
-                f"Could not DM {user.full_name} about hint limit.")
+            logger.info("Could not DM %s about hint limit.", user.full_name)
         return
 
     try:
@@ -463,138 +662,84 @@ async def handle_answer(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     if not message or not message.text:
         return
 
+    # Messages handled here never reach seen_message, so record the sender too
     record_user(update, context)
 
-    quiz = context.chat_data.get("quiz", {})
-    questions: list[dict] = quiz.get("questions")
-    if not questions:
-        logger.info(
-            f"Received answer but no quiz state for chat {update.effective_chat.id}")
+    # ANSWERING_CHATS normally keeps idle chats out; this covers a stale filter
+    chat_id = update.effective_chat.id
+    quiz = context.chat_data.get("quiz")
+    if quiz is None or not quiz.questions or not _is_accepting_answers(quiz):
+        ANSWERING_CHATS.remove_chat_ids(chat_id)
         return
 
-    idx = quiz.get("index", 0) % len(questions)
-    if not _is_accepting_answers(quiz):
-        logger.info(
-            f"Ignoring answer. Not accepting answers in chat {update.effective_chat.id}")
-        return
+    questions = quiz.questions
+    idx = quiz.index
 
-    # Ignore answers from members of that team if the team is muted
     user = update.effective_user
     user_id = user.id if user else None
-    teams = quiz.get("teams", {})
-    if teams and user_id is not None:
-        user_label = None
-        for lab, members in teams.items():
-            if any(uid == user_id for uid, _ in members):
-                user_label = lab
-                break
-
-        muted_label = quiz.get("muted_team")
-        muted_until = quiz.get("muted_until", 0)
-        if user_label and muted_label and user_label == muted_label:
-            from time import monotonic as _mon
-            if _mon() < muted_until:
-                logger.info(
-                    f"Ignoring answer from muted team {user_label} (user {user_id})")
-                return
-            else:
-                quiz.pop("muted_team", None)
-                quiz.pop("muted_until", None)
-                try:
-                    chat_id = update.effective_chat.id
-                    display = context.bot_data.get(
-                        f"TEAM_NAME_{muted_label}", muted_label)
-                    await context.bot.send_message(
-                        chat_id=chat_id,
-                        text=f"{display} are no longer muted. You may answer now."
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to announce unmute in handle_answer: {e}")
+    user_label = quiz.user_team.get(user_id) if user_id is not None else None
+
+    # Ignore answers from members of a muted team; the unmute timer
+    # in /mute announces when the mute runs out
+    if user_label and monotonic() < quiz.mute_deadlines.get(user_label, 0.0):
+        logger.info("Ignoring answer from muted team %s (user %s)", user_label, user_id)
+        return
 
     current = questions[idx]
-    answer = current.get("answer", "")
-    submitted = _normalize(message.text)
-    expected = _normalize(answer)
-    alternatives = [_normalize(item)
-                    for item in current.get("alternative", [])]
-    expected_values = {expected, *alternatives}
-
-    user_info = f"user {update.effective_user.id}" if update.effective_user else "anonymous user"
+    answer = current.answer
+    # Same as _normalize, inlined on the per-message path
+    submitted = message.text.strip().casefold()
+
     logger.info(
-        f"Answer attempt by {user_info} in chat {update.effective_chat.id}: "
-        f"submitted='{submitted}' expected='{expected}'"
+        "Answer attempt by user %s in chat %s: submitted='%s' expected='%s'",
+        user_id, chat_id, submitted, answer
     )
 
-    if submitted not in expected_values:
-        logger.info(
-            f"Incorrect answer by {user_info} in chat {update.effective_chat.id}")
+    if submitted not in current.expected:
+        logger.info("Incorrect answer by user %s in chat %s", user_id, chat_id)
         return
 
-    user = update.effective_user
-    user_id = user.id if user else None
     name = user.full_name if user else "Player"
 
     # Mark answered immediately to prevent race conditions
-    quiz["answered"] = True
-    _cancel_pending_tasks(quiz)
+    quiz.answered = True
+    ANSWERING_CHATS.remove_chat_ids(chat_id)
+    await _cancel_hint_task(quiz)
+    _prefetch_media(quiz, idx + 1)
 
     # Calculate score
-    start_ts = quiz.get("question_start_ts")
-    now_ts = monotonic()
-    elapsed = max(0.0, now_ts - start_ts) if start_ts else 0.0
-    points = quiz.get("current_points") or _points_for_elapsed(elapsed)
+    start_ns = quiz.question_start_ts
+    elapsed = max(0, monotonic_ns() - start_ns) / 1e9 if start_ns is not None else 0.0
+    points = quiz.current_points or _points_for_elapsed(elapsed)
 
-    teams = quiz.get("teams", {})
-    double_tags = quiz.get("double_tags", {})
     try:
-        user_label = None
-        if teams:
-            for lab, members in teams.items():
-                if any(uid == user_id for uid, _ in members):
-                    user_label = lab
-                    break
-
-        team_double_set = set()
-        if user_label and double_tags:
-            team_double_set = set(double_tags.get(user_label, set()))
-
-        question_tags = set(current.get("tags", [])) if current else set()
-        matched = question_tags & team_double_set
+        team_tags = quiz.double_tags.get(user_label) if user_label else None
+        matched = team_tags.intersection(current.tags) if team_tags and current.tags else None
         if matched:
             points = points * 2
             logger.info(
-                f"Doubling points for user {user_id} (team {user_label}) for tags {matched}")
+                "Doubling points for user %s (team %s) for tags %s", user_id, user_label, matched
+            )
     except Exception:
         logger.exception("Error applying double-tags multiplier")
 
-    context.bot_data[user_id] = name
-    scores = quiz.setdefault("scores", {})
-    scores[user_id] = scores.get(user_id, 0) + points
+    scores = quiz.scores
+    scores[user_id] += points
     logger.info(
-        f"Correct answer by user {user_id} in chat {update.effective_chat.id}; "
-        f"score now {scores[user_id]}"
+        "Correct answer by user %s in chat %s; score now %s", user_id, chat_id, scores[user_id]
     )
 
-    # Determine the answering user's team (if teams exist) and update streak
-    teams = quiz.get("teams", {})
-    label = "?"
-    if teams:
-        for lab, members in teams.items():
-            if any(uid == user_id for uid, _ in members):
-                label = lab
-                break
-
-    last_label = quiz.get("last_winning_team")
-    if label == last_label:
-        quiz["winning_streak"] = quiz.get("winning_streak", 0) + 1
+    # Update the streak for the answering user's team (if teams exist)
+    label = user_label or "?"
+
+    if label == quiz.last_winning_team:
+        quiz.winning_streak += 1
     else:
-        quiz["winning_streak"] = 1
-        quiz["last_winning_team"] = label
+        quiz.winning_streak = 1
+        quiz.last_winning_team = label
 
-    display_name = context.bot_data.get(
-        f"TEAM_NAME_{label}", label) if label and label != "?" else "?"
-    streak = quiz.get("winning_streak", 1)
+    display_name = team_names(context).get(label, label) if label and label != "?" else "?"
+    streak = quiz.winning_streak
 
     if label and label != "?" and streak >= 1:
         if streak >= 5:
@@ -615,34 +760,30 @@ async def handle_answer(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     if team_line:
         reply_lines.extend(["", team_line])
 
-    await message.reply_text("\n".join(reply_lines), parse_mode="Markdown")
-
-    try:
-        # Only send taunts on exact streak milestones: 3 or 5
-        if label and label != "?" and streak in (3, 5):
-            other_label = "A" if label == "B" else "B"
-            display_other = context.bot_data.get(
-                f"TEAM_NAME_{other_label}", other_label)
-            if streak == 5:
-                taunt = f"{display_other}, you guys are getting COOKED! 🥵"
-            else:
-                taunt = f"Uh oh {display_other}, {display_name} is finding their rhythm! 🕺"
-
-            await context.bot.send_message(chat_id=update.effective_chat.id, text=taunt)
-    except Exception:
-        logger.exception("Failed sending taunt to opposing team")
+    # Taunts on exact streak milestones (3 or 5) ride along in the same message
+    if label and label != "?" and streak in (3, 5):
+        other_label = "A" if label == "B" else "B"
+        display_other = team_names(context).get(other_label, other_label)
+        if streak == 5:
+            taunt = f"{display_other}, you guys are getting COOKED! 🥵"
+        else:
+            taunt = f"Uh oh {display_other}, {display_name} is finding their rhythm! 🕺"
+        reply_lines.extend(["", taunt])
 
+    # The countdown runs while the reply is on its way
     wait_seconds = context.bot_data.get("QUIZ_DELAY_SECONDS", 0)
-    await countdown_timer(
+    countdown = asyncio.create_task(countdown_timer(
         context=context,
-        chat_id=update.effective_chat.id,
+        chat_id=chat_id,
         seconds=wait_seconds,
-    )
+    ))
+
+    await message.reply_text("\n".join(reply_lines), parse_mode="Markdown")
+    await countdown
 
     # Advance to next question
     next_idx = idx + 1
     try:
         await send_question(update, context, next_idx)
     except Exception as err:
-        logger.warning(
-            f"Failed to send next question after correct answer: {err}")
+        logger.warning("Failed to send next question after correct answer: %s", err)
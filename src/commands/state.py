@@ -0,0 +1,74 @@
+"""Quiz data types shared by the command handlers."""
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+from telegram.ext import ContextTypes
+
+
+@dataclass(slots=True, frozen=True)
+class Question:
+    """One entry of questions.json, with answer lookups precomputed at load."""
+
+    question: str
+    answer: str
+    type: str = "text"
+    file: Optional[str] = None
+    tags: tuple[str, ...] = ()
+    alternative: tuple[str, ...] = ()
+    hints: tuple[str, ...] = ()
+    # Normalized accepted answers, non-space answer positions, how many of
+    # those each hint step reveals, and the fully masked hint fragments
+    expected: frozenset[str] = frozenset()
+    revealable: tuple[int, ...] = ()
+    reveal_counts: tuple[int, ...] = ()
+    hint_template: tuple[str, ...] = ()
+    # Ready-made Markdown for posting the question and for the timeout reveal
+    prompt: str = ""
+    reveal_text: str = ""
+
+
+@dataclass(slots=True)
+class QuizState:
+    """Everything the bot tracks for one chat, stored under `chat_data['quiz']`."""
+
+    # Game progress
+    questions: list[Question] = field(default_factory=list)
+    index: int = 0
+    generation: int = 0
+    scores: Counter[int] = field(default_factory=Counter)
+    last_winning_team: Optional[str] = None
+    winning_streak: int = 0
+
+    # Current question
+    answered: bool = False
+    accepting_answers: bool = False
+    question_start_ts: Optional[int] = None  # monotonic_ns()
+    current_points: Optional[int] = None
+    hint_task: Optional[asyncio.Task] = None
+    # (question index, task loading its media) started before that question is sent
+    media_prefetch: Optional[tuple[int, asyncio.Task]] = None
+
+    # Teams
+    teams: dict[str, list[tuple[int, str]]] = field(default_factory=dict)
+    user_team: dict[int, str] = field(default_factory=dict)
+    join_used: set[int] = field(default_factory=set)
+    team_scores: dict[str, int] = field(default_factory=dict)
+
+    # Team powers
+    # monotonic() deadline per muted team label; at most one entry at a time
+    mute_deadlines: dict[str, float] = field(default_factory=dict)
+    mute_enabled: dict[str, bool] = field(default_factory=dict)
+    mute_uses: dict[str, int] = field(default_factory=dict)
+    mute_tasks: set[asyncio.Task] = field(default_factory=set)
+    double_tags: dict[str, frozenset[str]] = field(default_factory=dict)
+
+
+def get_quiz(context: ContextTypes.DEFAULT_TYPE) -> QuizState:
+    """Return this chat's quiz state, creating an empty one if needed."""
+    quiz = context.chat_data.get("quiz")
+    if quiz is None:
+        quiz = context.chat_data["quiz"] = QuizState()
+    return quiz
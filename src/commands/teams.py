@@ -1,32 +1,45 @@
 import random
 import logging
 import asyncio
-import re
+from functools import lru_cache
 from time import monotonic
 
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from src.commands.utils import require_group, require_admin
+from src.commands.state import get_quiz
+from src.commands.utils import is_admin, deny_admin, index_teams, team_names
 
 logger = logging.getLogger(__name__)
 
 
 def _format_team(display_name: str, members: list[tuple[int, str]]) -> str:
-    lines = [f"Team {display_name} ({len(members)}):"]
-    for _, name in members:
-        lines.append(f"• {name}")
-    return "\n".join(lines)
+    header = f"Team {display_name} ({len(members)}):"
+    return "\n".join((header, *(f"• {name}" for _, name in members)))
+
+
+@lru_cache(maxsize=8)
+def _team_tokens(name_a: str, name_b: str) -> dict[str, str]:
+    # "a"/"b" go last so they win over a team named after the other letter
+    return {name_b.lower(): "B", name_a.lower(): "A", "a": "A", "b": "B"}
+
+
+def _resolve_label(context: ContextTypes.DEFAULT_TYPE, token: str) -> str | None:
+    """Map a team token ("a"/"b" or a configured team name) to its label."""
+    names = team_names(context)
+    tokens = _team_tokens(names["A"], names["B"])
+    return tokens.get(token.strip().lower())
 
 
-@require_group
 async def split_groups(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Split known players into two teams and store the assignment."""
-    if not await require_admin(update, context):
+    if not is_admin(update, context):
+        await deny_admin(update, context)
         return
 
-    quiz = context.chat_data.setdefault("quiz", {})
-    quiz.pop("teams", None)
+    quiz = get_quiz(context)
+    quiz.teams = {}
+    quiz.user_team = {}
     players = context.chat_data.get("players", {})
     logger.info("Known players:")
     for user_id, name in players.items():
@@ -38,79 +51,67 @@ async def split_groups(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         )
         return
 
-    name_a = context.bot_data.get("TEAM_NAME_A", "A")
-    name_b = context.bot_data.get("TEAM_NAME_B", "B")
+    names = team_names(context)
+    name_a, name_b = names["A"], names["B"]
 
     pairs = list(players.items())
-    random.shuffle(pairs)
-    if len(pairs) == 1:
-        team_a = pairs
-        team_b = []
-    else:
-        mid = len(pairs) // 2
-        team_a = pairs[:mid]
-        team_b = pairs[mid:]
-    quiz["teams"] = {"A": team_a, "B": team_b}
-
-    quiz.setdefault("mute_enabled", {"A": False, "B": False})
-    quiz.setdefault("mute_uses", {})
-    quiz.pop("muted_team", None)
-    quiz.pop("muted_until", None)
-
-    board = [
-        "Teams reshuffled!",
-        _format_team(name_a, team_a),
-        _format_team(name_b, team_b),
-    ]
-    await update.message.reply_text("\n\n".join(board))
+    # A lone player lands in team A; otherwise A takes the smaller half
+    mid = max(1, len(pairs) // 2)
+    picked = set(random.sample(range(len(pairs)), mid))
+    team_a = [p for i, p in enumerate(pairs) if i in picked]
+    team_b = [p for i, p in enumerate(pairs) if i not in picked]
+    quiz.teams = {"A": team_a, "B": team_b}
+    quiz.user_team = index_teams(quiz.teams)
+
+    quiz.mute_deadlines.clear()
+
+    await update.message.reply_text(
+        f"Teams reshuffled!\n\n{_format_team(name_a, team_a)}\n\n{_format_team(name_b, team_b)}"
+    )
 
 
-@require_group
 async def show_teams(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not await require_admin(update, context):
+    if not is_admin(update, context):
+        await deny_admin(update, context)
         return
 
-    quiz = context.chat_data.get("quiz", {})
-    teams = quiz.get("teams")
+    quiz = get_quiz(context)
+    teams = quiz.teams
     if not teams:
         await update.message.reply_text(
             "No teams yet. Use /group to split the current players."
         )
         return
 
-    name_a = context.bot_data.get("TEAM_NAME_A", "A")
-    name_b = context.bot_data.get("TEAM_NAME_B", "B")
+    names = team_names(context)
+    name_a, name_b = names["A"], names["B"]
 
-    board = [
-        "Current teams:",
-        _format_team(name_a, teams.get("A", [])),
-        _format_team(name_b, teams.get("B", [])),
-    ]
-    await update.message.reply_text("\n\n".join(board))
+    team_a = _format_team(name_a, teams.get("A", []))
+    team_b = _format_team(name_b, teams.get("B", []))
+    await update.message.reply_text(f"Current teams:\n\n{team_a}\n\n{team_b}")
 
 
-@require_group
 async def join(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Allow a user to join/switch to team A or B before the game starts. One use per user."""
     message = update.message
     if not message or not message.text or not message.from_user:
         return
 
-    parts = message.text.strip().split()
+    parts = message.text.split(maxsplit=2)
     if len(parts) < 2:
         await message.reply_text("Usage: /join <team>  e.g. /join a")
         return
 
-    token = parts[1].strip()
+    token = parts[1]
 
-    quiz = context.chat_data.setdefault("quiz", {})
-    teams = quiz.get("teams")
+    quiz = get_quiz(context)
+    teams = quiz.teams
     if not teams:
         await message.reply_text("No teams yet. Use /group to create teams first.")
         return
 
     # Disallow switching after the quiz has been started (questions present)
-    if quiz.get("questions"):
+    if quiz.questions:
         await message.reply_text("Team switching is only allowed before the game starts.")
         return
 
@@ -119,22 +120,12 @@ async def join(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     name = user.full_name
 
     # Track one-time usage
-    used = quiz.setdefault("join_used", set())
+    used = quiz.join_used
     if user_id in used:
         await message.reply_text("You have already used /join once and cannot switch teams again.")
         return
 
-    token_norm = token.lower()
-    label = None
-    if token_norm in ("a", "b"):
-        label = token_norm.upper()
-    else:
-        name_a = context.bot_data.get("TEAM_NAME_A", "A").lower()
-        name_b = context.bot_data.get("TEAM_NAME_B", "B").lower()
-        if token_norm == name_a:
-            label = "A"
-        elif token_norm == name_b:
-            label = "B"
+    label = _resolve_label(context, token)
 
     if not label:
         await message.reply_text(f"Unknown team: {token}")
@@ -148,31 +139,32 @@ async def join(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     # Add to target team if not already present
     teams.setdefault(label, [])
     teams[label].append((user_id, name))
+    quiz.user_team[user_id] = label
 
     used.add(user_id)
-    display_name = context.bot_data.get(f"TEAM_NAME_{label}", label)
+    display_name = team_names(context).get(label, label)
     await message.reply_text(f"You have joined {display_name}. (You cannot use /join again.)")
-    logger.info(f"User {user_id} joined team {label} via /join")
+    logger.info("User %s joined team %s via /join", user_id, label)
 
 
-@require_group
 async def add_points(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not await require_admin(update, context):
+    if not is_admin(update, context):
+        await deny_admin(update, context)
         return
 
     message = update.message
     if not message or not message.text:
         return
 
-    parts = message.text.strip().split()
+    parts = message.text.split(maxsplit=3)
     if len(parts) < 3:
         await message.reply_text("Usage: /add <team> <points>  e.g. /add a 10")
         return
 
-    team_token = parts[1].strip()
-    pts_token = parts[2].strip()
+    team_token = parts[1]
+    pts_token = parts[2]
 
-    logger.info(f"Adding points: team={team_token}, points={pts_token}")
+    logger.info("Adding points: team=%s, points=%s", team_token, pts_token)
 
     try:
         points = int(pts_token)
@@ -180,25 +172,15 @@ async def add_points(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         await message.reply_text(f"Invalid points value: {pts_token}")
         return
 
-    quiz = context.chat_data.get("quiz", {})
-    teams = quiz.get("teams") if quiz else None
+    quiz = get_quiz(context)
+    teams = quiz.teams
     if not teams:
         await message.reply_text(
             "No teams yet. Use /group to split the current players."
         )
         return
 
-    label = None
-    token_up = team_token.upper()
-    if token_up in teams:
-        label = token_up
-    else:
-        name_a = context.bot_data.get("TEAM_NAME_A", "A").lower()
-        name_b = context.bot_data.get("TEAM_NAME_B", "B").lower()
-        if team_token.lower() == name_a:
-            label = "A"
-        elif team_token.lower() == name_b:
-            label = "B"
+    label = _resolve_label(context, team_token)
 
     if not label:
         await message.reply_text(f"Unknown team: {team_token}")
@@ -209,32 +191,32 @@ async def add_points(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         await message.reply_text(f"Team {label} has no members to score.")
         return
 
-    team_scores = quiz.setdefault("team_scores", {})
+    team_scores = quiz.team_scores
     team_scores[label] = team_scores.get(label, 0) + points
 
-    display_name = context.bot_data.get(f"TEAM_NAME_{label}", label)
+    display_name = team_names(context).get(label, label)
     sign = "+" if points >= 0 else ""
     await message.reply_text(
         f"{display_name} {sign}{points} pts added to team {label} (team total: {team_scores[label]} pts)."
     )
 
 
-@require_group
 async def givemute(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not await require_admin(update, context):
+    if not is_admin(update, context):
+        await deny_admin(update, context)
         return
 
     message = update.message
     if not message or not message.text:
         return
 
-    parts = message.text.strip().split()
+    parts = message.text.split(maxsplit=3)
     if len(parts) < 3:
         await message.reply_text("Usage: /givemute <team> <count>  e.g. /givemute a 3")
         return
 
-    token = parts[1].strip()
-    raw = parts[2].strip()
+    token = parts[1]
+    raw = parts[2]
 
     try:
         count = int(raw)
@@ -246,243 +228,179 @@ async def givemute(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         await message.reply_text(f"Count must be positive: {raw}.")
         return
 
-    quiz = context.chat_data.setdefault("quiz", {})
-    teams = quiz.get("teams")
+    quiz = get_quiz(context)
+    teams = quiz.teams
     if not teams:
         await message.reply_text("No teams yet. Use /group to split the current players.")
         return
 
-    # Resolve token to internal label 'A' or 'B'
-    token_norm = token.lower()
-    label = None
-    if token_norm in ("a", "b"):
-        label = token_norm.upper()
-    else:
-        name_a = context.bot_data.get("TEAM_NAME_A", "A").lower()
-        name_b = context.bot_data.get("TEAM_NAME_B", "B").lower()
-        if token_norm == name_a:
-            label = "A"
-        elif token_norm == name_b:
-            label = "B"
+    label = _resolve_label(context, token)
 
     if not label:
         await message.reply_text(f"Unknown team: {token}")
         return
 
-    # Ensure label is normalized and store state under 'A' or 'B'
-    label = label.upper()
-    mute_enabled = quiz.setdefault("mute_enabled", {})
-    mute_uses = quiz.setdefault("mute_uses", {})
+    mute_enabled = quiz.mute_enabled
+    mute_uses = quiz.mute_uses
     mute_enabled[label] = True
     mute_uses[label] = count
 
-    display_name = context.bot_data.get(f"TEAM_NAME_{label}", label)
-    logger.info(
-        f"/givemute: enabled mute for label={label} (display={display_name})")
+    display_name = team_names(context).get(label, label)
+    logger.info("/givemute: enabled mute for label=%s (display=%s)", label, display_name)
     await message.reply_text(
         f"{display_name} can now use /mute ({mute_uses[label]} uses for the team this game)."
     )
-    other = "A" if label == "B" else "B"
-    mute_enabled.setdefault(other, False)
-    mute_uses.setdefault(other, 0)
 
 
-@require_group
 async def removemute(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not await require_admin(update, context):
+    if not is_admin(update, context):
+        await deny_admin(update, context)
         return
 
     message = update.message
     if not message or not message.text:
         return
 
-    parts = message.text.strip().split()
+    parts = message.text.split(maxsplit=2)
     if len(parts) < 2:
         await message.reply_text("Usage: /removemute <team>  e.g. /removemute a")
         return
 
-    token = parts[1].strip()
+    token = parts[1]
 
-    quiz = context.chat_data.get("quiz", {})
-    teams = quiz.get("teams") if quiz else None
+    quiz = get_quiz(context)
+    teams = quiz.teams
     if not teams:
         await message.reply_text("No teams yet. Use /group to split the current players.")
         return
-    token_norm = token.strip().lower()
-    label = None
-    if token_norm in ("a", "b"):
-        label = token_norm.upper()
-    else:
-        name_a = context.bot_data.get("TEAM_NAME_A", "A").lower()
-        name_b = context.bot_data.get("TEAM_NAME_B", "B").lower()
-        if token_norm == name_a:
-            label = "A"
-        elif token_norm == name_b:
-            label = "B"
+    label = _resolve_label(context, token)
 
     if not label:
         await message.reply_text(f"Unknown team: {token}")
         return
 
-    label = label.upper()
-    mute_enabled = quiz.setdefault("mute_enabled", {})
-    mute_uses = quiz.setdefault("mute_uses", {})
+    mute_enabled = quiz.mute_enabled
+    mute_uses = quiz.mute_uses
     mute_enabled[label] = False
     mute_uses.pop(label, None)
 
-    # Cancel any active mute tasks for this quiz and clear muted state if matching
-    mute_tasks = quiz.setdefault("mute_tasks", [])
-    # Clear muted team if it matches the label being removed
-    if quiz.get("muted_team") == label:
-        quiz.pop("muted_team", None)
-        quiz.pop("muted_until", None)
-
-        for t in list(mute_tasks):
-            try:
-                if not t.done():
-                    t.cancel()
-            except Exception:
-                pass
-        quiz["mute_tasks"] = []
-
-    display_name = context.bot_data.get(f"TEAM_NAME_{label}", label)
-    logger.info(
-        f"/removemute: disabled mute for label={label} (display={display_name})")
+    # Lift the mute on this team if there is one, cancelling its pending
+    # unmute; finished tasks have already removed themselves
+    if quiz.mute_deadlines.pop(label, None) is not None:
+        for t in quiz.mute_tasks:
+            t.cancel()
+        quiz.mute_tasks.clear()
+
+    display_name = team_names(context).get(label, label)
+    logger.info("/removemute: disabled mute for label=%s (display=%s)", label, display_name)
     await message.reply_text(f"{display_name} can no longer use /mute.")
 
 
-@require_group
 async def enabledouble(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Enable double-points for a team for questions with a specific tag."""
-    if not await require_admin(update, context):
+    if not is_admin(update, context):
+        await deny_admin(update, context)
         return
 
     message = update.message
     if not message or not message.text:
         return
 
-    parts = message.text.strip().split()
+    parts = message.text.split(maxsplit=3)
     if len(parts) < 3:
         await message.reply_text("Usage: /enabledouble <team> <tag>  e.g. /enabledouble a brand")
         return
 
-    token = parts[1].strip()
-    tag = parts[2].strip()
+    token = parts[1]
+    tag = parts[2]
 
-    quiz = context.chat_data.setdefault("quiz", {})
-    teams = quiz.get("teams")
+    quiz = get_quiz(context)
+    teams = quiz.teams
     if not teams:
         await message.reply_text("No teams yet. Use /group to split the current players.")
         return
 
-    token_norm = token.lower()
-    label = None
-    if token_norm in ("a", "b"):
-        label = token_norm.upper()
-    else:
-        name_a = context.bot_data.get("TEAM_NAME_A", "A").lower()
-        name_b = context.bot_data.get("TEAM_NAME_B", "B").lower()
-        if token_norm == name_a:
-            label = "A"
-        elif token_norm == name_b:
-            label = "B"
+    label = _resolve_label(context, token)
 
     if not label:
         await message.reply_text(f"Unknown team: {token}")
         return
 
-    double_tags = quiz.setdefault("double_tags", {"A": set(), "B": set()})
-    # ensure sets exist for labels
-    double_tags.setdefault("A", set())
-    double_tags.setdefault("B", set())
+    # Tag sets are frozen and replaced on write; answer scoring only reads them
+    double_tags = quiz.double_tags
+    double_tags[label] = double_tags.get(label, frozenset()) | {tag}
 
-    double_tags[label].add(tag)
-
-    display_name = context.bot_data.get(f"TEAM_NAME_{label}", label)
-    logger.info(f"/enabledouble: enabled double for label={label} tag={tag}")
+    display_name = team_names(context).get(label, label)
+    logger.info("/enabledouble: enabled double for label=%s tag=%s", label, tag)
     await message.reply_text(f"{display_name} will now receive double points for questions tagged '{tag}'.")
 
 
-@require_group
 async def disabledouble(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Disable double-points for a team for a specific tag."""
-    if not await require_admin(update, context):
+    if not is_admin(update, context):
+        await deny_admin(update, context)
         return
 
     message = update.message
     if not message or not message.text:
         return
 
-    parts = message.text.strip().split()
+    parts = message.text.split(maxsplit=3)
     if len(parts) < 3:
         await message.reply_text("Usage: /disabledouble <team> <tag>  e.g. /disabledouble a brand")
         return
 
-    token = parts[1].strip()
-    tag = parts[2].strip()
+    token = parts[1]
+    tag = parts[2]
 
-    quiz = context.chat_data.get("quiz", {})
-    teams = quiz.get("teams") if quiz else None
+    quiz = get_quiz(context)
+    teams = quiz.teams
     if not teams:
         await message.reply_text("No teams yet. Use /group to split the current players.")
         return
 
-    token_norm = token.lower()
-    label = None
-    if token_norm in ("a", "b"):
-        label = token_norm.upper()
-    else:
-        name_a = context.bot_data.get("TEAM_NAME_A", "A").lower()
-        name_b = context.bot_data.get("TEAM_NAME_B", "B").lower()
-        if token_norm == name_a:
-            label = "A"
-        elif token_norm == name_b:
-            label = "B"
+    label = _resolve_label(context, token)
 
     if not label:
         await message.reply_text(f"Unknown team: {token}")
         return
 
-    double_tags = quiz.setdefault("double_tags", {"A": set(), "B": set()})
-    double_tags.setdefault("A", set())
-    double_tags.setdefault("B", set())
-
-    if tag in double_tags.get(label, set()):
-        double_tags[label].discard(tag)
-        display_name = context.bot_data.get(f"TEAM_NAME_{label}", label)
-        logger.info(
-            f"/disabledouble: disabled double for label={label} tag={tag}")
+    double_tags = quiz.double_tags
+    team_tags = double_tags.get(label, frozenset())
+    if tag in team_tags:
+        double_tags[label] = team_tags - {tag}
+        display_name = team_names(context).get(label, label)
+        logger.info("/disabledouble: disabled double for label=%s tag=%s", label, tag)
         await message.reply_text(f"{display_name} will no longer receive double points for questions tagged '{tag}'.")
     else:
         await message.reply_text(f"Team {label} did not have double-points enabled for tag '{tag}'.")
 
 
-@require_group
 async def showtags(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not await require_admin(update, context):
+    if not is_admin(update, context):
+        await deny_admin(update, context)
         return
 
     user = update.effective_user
     if not user:
         return
 
-    quiz = context.chat_data.get("quiz", {})
-    double_tags = quiz.get("double_tags", {})
+    quiz = get_quiz(context)
+    double_tags = quiz.double_tags
 
-    a_tags = sorted(list(double_tags.get("A", set())))
-    b_tags = sorted(list(double_tags.get("B", set())))
+    a_tags = sorted(double_tags.get("A", ()))
+    b_tags = sorted(double_tags.get("B", ()))
 
     msg_lines = ["Current tag assignments:",
                  f"Team A: {', '.join(a_tags) if a_tags else '(none)'}", f"Team B: {', '.join(b_tags) if b_tags else '(none)'}"]
 
     try:
         await context.bot.send_message(chat_id=user.id, text="\n".join(msg_lines))
-        logger.info(f"/showtags: sent double-tag mappings to user {user.id}")
+        logger.info("/showtags: sent double-tag mappings to user %s", user.id)
     except Exception:
-        logger.info(f"Could not DM user {user.id} the tag mappings.")
+        logger.info("Could not DM user %s the tag mappings.", user.id)
 
 
-@require_group
 async def mute(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Team members can call /mute while their team has been granted mute ability.
 
@@ -497,18 +415,13 @@ async def mute(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     user = update.effective_user
     user_id = user.id
 
-    quiz = context.chat_data.get("quiz", {})
-    teams = quiz.get("teams") if quiz else None
+    quiz = get_quiz(context)
+    teams = quiz.teams
     if not teams:
         logging.info("No teams found for /mute command.")
         return
 
-    user_label = None
-    for lab, members in teams.items():
-        if any(uid == user_id for uid, _ in members):
-            user_label = lab
-            break
-
+    user_label = quiz.user_team.get(user_id)
     if not user_label:
         try:
             await context.bot.send_message(
@@ -516,12 +429,11 @@ async def mute(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
                 text=f"You are not assigned to any team, so you cannot use /mute.",
             )
         except Exception:
-            logger.info(
-                f"Could not DM {user} about missing hint.")
+            logger.info("Could not DM %s about missing hint.", user)
         return
 
-    mute_enabled = quiz.setdefault("mute_enabled", {})
-    mute_uses = quiz.setdefault("mute_uses", {})
+    mute_enabled = quiz.mute_enabled
+    mute_uses = quiz.mute_uses
     user_label = str(user_label).upper()
     if not mute_enabled.get(user_label, False):
         try:
@@ -530,8 +442,7 @@ async def mute(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
                 text=(f"Your team is not allowed to use /mute."),
             )
         except Exception:
-            logger.info(
-                f"Could not DM {user}.")
+            logger.info("Could not DM %s.", user)
         return
 
     remaining = mute_uses.get(user_label, 0)
@@ -542,26 +453,25 @@ async def mute(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
                 text=f"Your team has no remaining /mute uses.",
             )
         except Exception:
-            logger.info(
-                f"Could not DM {user}.")
+            logger.info("Could not DM %s.", user)
         return
 
     mute_uses[user_label] = remaining - 1
-    display_name = context.bot_data.get(f"{user_label}", user_label)
+    display_name = team_names(context).get(user_label, user_label)
     await message.reply_text(
         f"{display_name} used /mute. Remaining team mutes: {mute_uses[user_label]}"
     )
 
     other_label = "A" if user_label == "B" else "B"
-    quiz["muted_team"] = other_label
-    quiz["muted_until"] = monotonic() + 20
+    until = monotonic() + 20
+    # Only one team is muted at a time, so this also lifts any mute on ours
+    quiz.mute_deadlines.clear()
+    quiz.mute_deadlines[other_label] = until
 
-    logger.info(
-        f"Team {other_label} muted for 20 seconds by team {user_label}.")
+    logger.info("Team %s muted for 20 seconds by team %s.", other_label, user_label)
 
     chat = update.effective_chat
-    display_other = context.bot_data.get(
-        f"TEAM_NAME_{other_label}", other_label)
+    display_other = team_names(context).get(other_label, other_label)
     await context.bot.send_message(
         chat_id=chat.id,
         text=f"{display_other} are muted for 20 seconds. Their answers will be ignored."
@@ -570,27 +480,22 @@ async def mute(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     async def _clear_mute_after(delay: int, chat_id: int, muted_label: str) -> None:
         try:
             await asyncio.sleep(delay)
-            # Only clear if still muted and the mute has expired
-            if quiz.get("muted_team") == muted_label and monotonic() >= quiz.get("muted_until", 0):
-                quiz.pop("muted_team", None)
-                quiz.pop("muted_until", None)
-                display = context.bot_data.get(
-                    f"TEAM_NAME_{muted_label}", muted_label)
-                logger.info(
-                    f"Clearing mute for team {muted_label} after {delay} seconds.")
+            # Skip if this mute was lifted, replaced or extended meanwhile
+            if quiz.mute_deadlines.get(muted_label) == until:
+                del quiz.mute_deadlines[muted_label]
+                display = team_names(context).get(muted_label, muted_label)
+                logger.info("Clearing mute for team %s after %s seconds.", muted_label, delay)
                 await context.bot.send_message(
                     chat_id=chat_id,
                     text=f"{display} are no longer muted. You may answer now."
                 )
-                logger.info(
-                    f"Cleared mute for team {muted_label} after {delay} seconds.")
+                logger.info("Cleared mute for team %s after %s seconds.", muted_label, delay)
         except asyncio.CancelledError:
-            logger.info(
-                f"Mute clear task for team {muted_label} was cancelled.")
+            logger.info("Mute clear task for team %s was cancelled.", muted_label)
             pass
         except Exception as e:
-            logger.warning(f"Failed clearing mute: {e}")
+            logger.warning("Failed clearing mute: %s", e)
 
-    mute_tasks = quiz.setdefault("mute_tasks", [])
-    mute_tasks.append(asyncio.create_task(
-        _clear_mute_after(20, chat.id, other_label)))
+    task = asyncio.create_task(_clear_mute_after(20, chat.id, other_label))
+    quiz.mute_tasks.add(task)
+    task.add_done_callback(quiz.mute_tasks.discard)
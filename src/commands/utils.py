@@ -2,8 +2,6 @@
 
 import asyncio
 import logging
-from functools import wraps
-from typing import Callable, Coroutine, Any
 
 from telegram import Update
 from telegram.ext import ContextTypes
@@ -11,45 +9,41 @@ from telegram.ext import ContextTypes
 logger = logging.getLogger(__name__)
 
 
-def require_group(func: Callable[..., Coroutine[Any, Any, None]]) -> Callable[..., Coroutine[Any, Any, None]]:
-    """Decorator to ensure command is only used in group chats."""
-    @wraps(func)
-    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
-        chat = update.effective_chat
-        if chat.type not in {"group", "supergroup"}:
-            await update.effective_message.reply_text(
-                "This command can only be used in a group chat."
-            )
-            return
-        return await func(update, context, *args, **kwargs)
-    return wrapper
+async def group_only_notice(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Reply to a group-only command sent outside a group chat.
 
+    Group-only commands are registered with a `filters.ChatType.GROUPS`
+    filter; this handler catches the same commands everywhere else.
+    """
+    await update.effective_message.reply_text(
+        "This command can only be used in a group chat."
+    )
 
-async def require_admin(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
-    """Check if the user is the configured admin. Returns True if allowed."""
-    admin_id = context.bot_data.get("ADMIN_USER_ID")
-    user = update.effective_user
 
+def is_admin(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
+    """Check if the user is the configured admin (anyone, if none is set)."""
+    admin_id = context.bot_data.get("ADMIN_USER_ID")
     if admin_id is None:
         return True
+    user = update.effective_user
+    return user is not None and user.id == admin_id
 
-    if not user or user.id != admin_id:
-        logger.info(
-            f"Non-admin attempted restricted command in chat {update.effective_chat.id}"
-        )
 
-        if user:
-            try:
-                await context.bot.send_message(
-                    chat_id=user.id,
-                    text=f"You do not have permission to run this command in *{update.effective_chat.title}*.",
-                    parse_mode="Markdown"
-                )
-                logger.info(f"Sent permission denial DM to user {user.id}")
-            except Exception as e:
-                logger.info(f"Failed to DM user {user.id}: {e}")
-        return False
-    return True
+async def deny_admin(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """DM a non-admin that the command they ran is restricted."""
+    logger.info("Non-admin attempted restricted command in chat %s", update.effective_chat.id)
+    user = update.effective_user
+    if not user:
+        return
+    try:
+        await context.bot.send_message(
+            chat_id=user.id,
+            text=f"You do not have permission to run this command in *{update.effective_chat.title}*.",
+            parse_mode="Markdown"
+        )
+        logger.info("Sent permission denial DM to user %s", user.id)
+    except Exception as e:
+        logger.info("Failed to DM user %s: %s", user.id, e)
 
 
 def record_user(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -57,8 +51,29 @@ def record_user(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     user = update.effective_user
     if not user:
         return
-    players = context.chat_data.setdefault("players", {})
-    players[user.id] = user.full_name or "Player"
+    players = context.chat_data.get("players")
+    if players is None:
+        players = context.chat_data["players"] = {}
+    name = user.full_name or "Player"
+    # Most messages come from already-known users; skip the redundant write
+    if players.get(user.id) != name:
+        players[user.id] = name
+
+
+def team_names(context: ContextTypes.DEFAULT_TYPE) -> dict[str, str]:
+    """Display name per team label, read from config once and kept in bot_data."""
+    names = context.bot_data.get("_team_names")
+    if names is None:
+        names = context.bot_data["_team_names"] = {
+            "A": context.bot_data.get("TEAM_NAME_A", "A"),
+            "B": context.bot_data.get("TEAM_NAME_B", "B"),
+        }
+    return names
+
+
+def index_teams(teams: dict[str, list[tuple[int, str]]]) -> dict[int, str]:
+    """Build a user_id -> team label index for O(1) team lookups."""
+    return {uid: label for label, members in teams.items() for uid, _ in members}
 
 
 async def seen_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -71,7 +86,9 @@ async def seen_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     try:
         record_user(update, context)
         logger.debug(
-            f"Recorded seen user for chat {update.effective_chat.id if update.effective_chat else 'unknown'}")
+            "Recorded seen user for chat %s",
+            update.effective_chat.id if update.effective_chat else 'unknown'
+        )
     except Exception:
         logger.exception("Failed to record seen user")
 
@@ -89,7 +106,7 @@ async def countdown_timer(
         return
 
     if not fancy_animation:
-        await asyncio.sleep(5)
+        await asyncio.sleep(seconds)
         return
 
     try:
@@ -98,15 +115,19 @@ async def countdown_timer(
             text=f"{start_text} {seconds}..."
         )
 
-        for remaining in range(seconds - 1, 0, -1):
-            await asyncio.sleep(update_interval)
+        # Edit only at the halfway point and the last tick rather than every
+        # interval, keeping the total duration at seconds * update_interval
+        shown = seconds
+        for remaining in sorted({seconds // 2, 1} - {0, seconds}, reverse=True):
+            await asyncio.sleep((shown - remaining) * update_interval)
             await context.bot.edit_message_text(
                 chat_id=chat_id,
                 message_id=countdown_msg.message_id,
                 text=f"{start_text} {remaining}..."
             )
+            shown = remaining
 
-        await asyncio.sleep(update_interval)
+        await asyncio.sleep(shown * update_interval)
         await context.bot.edit_message_text(
             chat_id=chat_id,
             message_id=countdown_msg.message_id,
@@ -117,4 +138,4 @@ async def countdown_timer(
     except asyncio.CancelledError:
         raise
     except Exception as e:
-        logger.error(f"Countdown failed: {e}")
+        logger.error("Countdown failed: %s", e)
@@ -4,6 +4,7 @@ from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters
 
 from src.config import load_config
+from src.rate_limiter import QuizRateLimiter
 from src.commands import (
     start,
     hint,
@@ -20,7 +21,8 @@ from src.commands import (
     givemute,
     removemute
 )
-from src.commands.utils import seen_message
+from src.commands.quiz import ANSWERING_CHATS, QUESTIONS_FILE, load_questions
+from src.commands.utils import group_only_notice, seen_message
 
 logging.basicConfig(
     level=logging.INFO,
@@ -36,7 +38,19 @@ def main() -> None:
     """Initialize and run the bot."""
     cfg = load_config()
 
-    app = Application.builder().token(cfg["TELEGRAM_BOT_TOKEN"]).build()
+    app = (
+        Application.builder()
+        .token(cfg["TELEGRAM_BOT_TOKEN"])
+        .rate_limiter(QuizRateLimiter())
+        .build()
+    )
+
+    # Parse questions.json up front so the first /start doesn't pay for it;
+    # /start reloads it only if the file changes afterwards
+    try:
+        logger.info("Loaded %s questions from %s", len(load_questions()), QUESTIONS_FILE)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not preload questions from %s: %s", QUESTIONS_FILE, e)
 
     # Store config in bot_data for access in handlers
     app.bot_data["QUIZ_DELAY_SECONDS"] = cfg.get("QUIZ_DELAY_SECONDS", 0)
@@ -44,25 +58,37 @@ def main() -> None:
     app.bot_data["TEAM_NAME_A"] = cfg.get("TEAM_NAME_A", "A")
     app.bot_data["TEAM_NAME_B"] = cfg.get("TEAM_NAME_B", "B")
 
-    # Register command handlers
-    app.add_handler(CommandHandler("start", start))
-    app.add_handler(CommandHandler("add", add_points))
-    app.add_handler(CommandHandler("scores", show_scores))
+    # Register command handlers; group-only commands are filtered at dispatch.
+    # An explicit filter replaces CommandHandler's UpdateType.MESSAGES default;
+    # UpdateType.MESSAGE keeps channel posts out and stops edited commands
+    # (e.g. a corrected /start) from running a second time.
+    group_commands = {
+        "start": start,
+        "add": add_points,
+        "scores": show_scores,
+        "group": split_groups,
+        "team": show_teams,
+        "join": join,
+        "givedouble": enabledouble,
+        "removedouble": disabledouble,
+        "showtags": showtags,
+        "mute": mute,
+        "givemute": givemute,
+        "removemute": removemute,
+    }
+    for command, callback in group_commands.items():
+        app.add_handler(CommandHandler(
+            command, callback, filters=filters.UpdateType.MESSAGE & filters.ChatType.GROUPS))
+    app.add_handler(CommandHandler(
+        list(group_commands), group_only_notice,
+        filters=filters.UpdateType.MESSAGE & ~filters.ChatType.GROUPS))
     app.add_handler(CommandHandler("hint", hint))
-    app.add_handler(CommandHandler("group", split_groups))
-    app.add_handler(CommandHandler("team", show_teams))
-    app.add_handler(CommandHandler("join", join))
-    app.add_handler(CommandHandler("givedouble", enabledouble))
-    app.add_handler(CommandHandler("removedouble", disabledouble))
-    app.add_handler(CommandHandler("showtags", showtags))
-    app.add_handler(CommandHandler("mute", mute))
-    app.add_handler(CommandHandler("givemute", givemute))
-    app.add_handler(CommandHandler("removemute", removemute))
 
-    # Register message handler for answers
+    # Register message handler for answers; it only matches while a
+    # question is open, so other chatter falls through to seen_message
     app.add_handler(
         MessageHandler(
-            filters.ChatType.GROUPS & filters.TEXT & ~filters.COMMAND,
+            ANSWERING_CHATS & filters.ChatType.GROUPS & filters.TEXT & ~filters.COMMAND,
             handle_answer
         )
     )
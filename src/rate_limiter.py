@@ -0,0 +1,112 @@
+"""Outgoing Bot API rate limiting, kept under Telegram's flood limits."""
+
+import asyncio
+import logging
+from time import monotonic
+from typing import Any, Callable, Coroutine
+
+from telegram.error import RetryAfter
+from telegram.ext import BaseRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Telegram allows ~30 messages/second overall and ~20 messages/minute per group
+GLOBAL_RATE = (30, 1.0)
+GROUP_RATE = (20, 60.0)
+MAX_RETRIES = 1
+
+
+class _Bucket:
+    """Token bucket: up to `rate` calls per `period` seconds, bursting to `rate`."""
+
+    def __init__(self, rate: int, period: float) -> None:
+        self._rate = rate
+        self._interval = period / rate
+        self._tokens = float(rate)
+        self._updated = monotonic()
+        self._lock = asyncio.Lock()
+
+    def is_full(self, now: float) -> bool:
+        """True once the bucket has refilled and nobody is waiting on it."""
+        return (not self._lock.locked()
+                and self._tokens + (now - self._updated) / self._interval >= self._rate)
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock, so they are served in arrival order
+        async with self._lock:
+            while True:
+                now = monotonic()
+                self._tokens = min(
+                    self._rate, self._tokens + (now - self._updated) / self._interval)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self._interval)
+
+
+class QuizRateLimiter(BaseRateLimiter[int]):
+    """Throttle Bot API calls globally and per group chat.
+
+    Requests wait for a free slot instead of running into 429 errors. A
+    RetryAfter that still gets through is retried after the delay Telegram
+    asks for, up to `rate_limit_args` (default MAX_RETRIES) times.
+    """
+
+    def __init__(self) -> None:
+        self._global = _Bucket(*GLOBAL_RATE)
+        self._groups: dict[int, _Bucket] = {}
+        self._last_prune = monotonic()
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    def _prune_groups(self) -> None:
+        # A full bucket behaves exactly like a new one, so it can be dropped.
+        # Sweep at most once per refill period to keep this off the hot path.
+        now = monotonic()
+        if now - self._last_prune < GROUP_RATE[1]:
+            return
+        self._last_prune = now
+        for chat_id in [cid for cid, bucket in self._groups.items() if bucket.is_full(now)]:
+            del self._groups[chat_id]
+
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, Any]],
+        args: Any,
+        kwargs: dict[str, Any],
+        endpoint: str,
+        data: dict[str, Any],
+        rate_limit_args: int | None,
+    ) -> Any:
+        max_retries = MAX_RETRIES if rate_limit_args is None else rate_limit_args
+
+        # Only requests aimed at a chat count; group chats have negative ids
+        chat_id = data.get("chat_id")
+        try:
+            chat_id = int(chat_id) if chat_id is not None else None
+        except (TypeError, ValueError):
+            chat_id = None
+
+        for attempt in range(max_retries + 1):
+            if chat_id is not None:
+                if chat_id < 0:
+                    bucket = self._groups.get(chat_id)
+                    if bucket is None:
+                        self._prune_groups()
+                        bucket = self._groups[chat_id] = _Bucket(*GROUP_RATE)
+                    await bucket.acquire()
+                await self._global.acquire()
+            try:
+                return await callback(*args, **kwargs)
+            except RetryAfter as exc:
+                if attempt == max_retries:
+                    raise
+                delay = exc.retry_after
+                delay = delay.total_seconds() if hasattr(delay, "total_seconds") else float(delay)
+                logger.info("Rate limited on %s; retrying in %.1fs", endpoint, delay)
+                await asyncio.sleep(delay + 0.1)